@@ -22,281 +22,208 @@ From the documentation:
     not possible to determine the type of error logged in MCA_DESTAT
 '''
 
-import sys
+from collections import namedtuple
+from functools import lru_cache
 
 
-class ErrorCodeExt:
-    def __init__(self, code, acronym, description):
-        self.code = code
-        self.acronym = acronym
-        self.description = description
+class ErrorCodeExt(namedtuple("ErrorCodeExt", "code acronym description")):
+    __slots__ = ()
 
     def __str__(self):
-        return "{} ({} 0x{:x})".format(self.description, self.acronym, self.code)
+        return f"{self.description} ({self.acronym} 0x{self.code:x})"
 
-class Block:
-    def __init__(self):
-        self._pos_error_high = 21
-        self._pos_error_low = 16
-
-    def _extract_error_code_ext(self, status):
-        mask = (1<<(self._pos_error_high))-1 & ~((1<<self._pos_error_low)-1)
-        return (mask & status) >> self._pos_error_low
-
-    def decode_error(self, status):
-        code = self._extract_error_code_ext(status)
-        acronym = ""
-        if code < len(self._errors_acronyms):
-            acronym = self._errors_acronyms[code]
-        description = ""
-        if acronym in self._errors_descriptions:
-            description = self._errors_descriptions[acronym]
-        return ErrorCodeExt(code, acronym, description)
+# MCA_STATUS[ErrorCodeExt], bits 21:16
+_ERR_SHIFT = 16
+_ERR_MASK = 0x3F
 
-    def __str__(self):
-        return "{} ({})".format(self._description, self._acronym)
+# A block only describes a MCA bank type: decoding goes through _LUT
+class Block:
+    __slots__ = ()
 
 class BlockRAZ(Block):
-    def __init__(self):
-        Block.__init__(self)
-        self._acronym = "RAZ"
-        self._description = "Read-As-Zero"
-        self._errors_acronyms = []
-        self._errors_descriptions = {}
+    __slots__ = ()
+    _acronym = "RAZ"
+    _description = "Read-As-Zero"
+    _errors = ()
 
 class BlockReserved(Block):
-    def __init__(self):
-        Block.__init__(self)
-        self._acronym = "Reserved"
-        self._description = "Reserved"
-        self._errors_acronyms = []
-        self._errors_descriptions = {}
+    __slots__ = ()
+    _acronym = "Reserved"
+    _description = "Reserved"
+    _errors = ()
 
 class BlockLS(Block):
-    def __init__(self):
-        Block.__init__(self)
-        self._acronym = "LS"
-        self._description = "Load-Store Unit"
-        self._errors_acronyms = [
-            "LDQ", "STQ", "MAB", "L1DTLB", "DcTagErr5", "DcTagErr6", "DcTagErr1",
-            "IntErrTyp1", "IntErrTyp2", "SystemReadDataErrorT0", "SystemReadDataErrorT1",
-            "DcTagErr2", "DcDataErr1", "DcDataErr2", "DcDataErr3", "DcTagErr4", "L2DTLB",
-            "PDC", "DcTagErr3", "DcTagErr7", "L2DataErr"
-        ]
-        self._errors_descriptions = {
-            "L2DataErr": "L2 Fill Data error",
-            "DcTagErr7": "DC Tag error type 7",
-            "DcTagErr5": "DC Tag error type 5",
-            "DcTagErr3": "DC Tag error type 3",
-            "PDC": "MCA_ADDR_LS logs a virtual address",
-            "L2DTLB": "MCA_ADDR_LS logs a virtual address",
-            "DcTagErr4": "DC Tag error type 4",
-            "DcDataErr3": "DC Data error type 3",
-            "DcDataErr2": "DC Data error type 2",
-            "DcDataErr1": "DC Data error type 1 and poison consumption MCA_STATUS[Poison] is set on poison consumption from L2/L3",
-            "DcTagErr2": "DC Tag error type 2",
-            "SystemReadDataErrorT1": "System Read Data Error Thread 1An error in a read of a line from the data fabric",
-            "SystemReadDataErrorT0": "System Read Data Error Thread 0An error in a read of a line from the data fabric",
-            "IntErrTyp2": "Internal error type 2",
-            "IntErrTyp1": "Internal error type 1",
-            "DcTagErr1": "DC Tag error type 1",
-            "DcTagErr6": "DC Tag error type 6",
-            "L1DTLB": "Level 1 TLB parity error",
-            "MAB": "Miss address buffer payload parity error",
-            "STQ": "Store queue parity error",
-            "LDQ": "Load queue parity error"
-        }
+    __slots__ = ()
+    _acronym = "LS"
+    _description = "Load-Store Unit"
+    _errors = (
+        ("LDQ", "Load queue parity error"),
+        ("STQ", "Store queue parity error"),
+        ("MAB", "Miss address buffer payload parity error"),
+        ("L1DTLB", "Level 1 TLB parity error"),
+        ("DcTagErr5", "DC Tag error type 5"),
+        ("DcTagErr6", "DC Tag error type 6"),
+        ("DcTagErr1", "DC Tag error type 1"),
+        ("IntErrTyp1", "Internal error type 1"),
+        ("IntErrTyp2", "Internal error type 2"),
+        ("SystemReadDataErrorT0", "System Read Data Error Thread 0An error in a read of a line from the data fabric"),
+        ("SystemReadDataErrorT1", "System Read Data Error Thread 1An error in a read of a line from the data fabric"),
+        ("DcTagErr2", "DC Tag error type 2"),
+        ("DcDataErr1", "DC Data error type 1 and poison consumption MCA_STATUS[Poison] is set on poison consumption from L2/L3"),
+        ("DcDataErr2", "DC Data error type 2"),
+        ("DcDataErr3", "DC Data error type 3"),
+        ("DcTagErr4", "DC Tag error type 4"),
+        ("L2DTLB", "MCA_ADDR_LS logs a virtual address"),
+        ("PDC", "MCA_ADDR_LS logs a virtual address"),
+        ("DcTagErr3", "DC Tag error type 3"),
+        ("DcTagErr7", "DC Tag error type 7"),
+        ("L2DataErr", "L2 Fill Data error"),
+    )
 
 class BlockIF(Block):
-    def __init__(self):
-        Block.__init__(self)
-        self._acronym = "IF"
-        self._description = "Instruction Fetch Unit"
-        self._errors_acronyms = [
-            "OcUtagParity", "TagMultiHit","TagParity", "DataParity","DqParity",
-            "L0ItlbParity", "L1ItlbParity", "L2ItlbParity", "BpqSnpParT0", "BpqSnpParT1",
-            "L1BtbMultiHit", "L2BtbMultiHit", "L2RespPoison", "SystemReadDataError"
-        ]
-        self._errors_descriptions = {
-            "SystemReadDataError": "System Read Data Error. An error in a demand fetch of a line",
-            "L2RespPoison": "L2 Cache Response Poison Error. Error is the result of consuming poison data",
-            "L2BtbMultiHit": "L2 BTB Multi-Match Error",
-            "L1BtbMultiHit": "L1 BTB Multi-Match Error",
-            "BpqSnpParT1": "BPQ Thread 1 Snoop Parity Error",
-            "BpqSnpParT0": "BPQ Thread 0 Snoop Parity Error",
-            "L2ItlbParity": "L2 ITLB Parity Error",
-            "L1ItlbParity": "L1 ITLB Parity Error",
-            "L0ItlbParity": "L0 ITLB Parity Error",
-            "DqParity": "Decoupling Queue PhysAddr Parity Error",
-            "DataParity": "IC Data Array Parity Error",
-            "TagParity": "IC Full Tag Parity Error",
-            "TagMultiHit": "IC Microtag or Full Tag Multi-hit Error",
-            "OcUtagParity": "Op Cache Microtag Probe Port Parity Error"
-        }
+    __slots__ = ()
+    _acronym = "IF"
+    _description = "Instruction Fetch Unit"
+    _errors = (
+        ("OcUtagParity", "Op Cache Microtag Probe Port Parity Error"),
+        ("TagMultiHit", "IC Microtag or Full Tag Multi-hit Error"),
+        ("TagParity", "IC Full Tag Parity Error"),
+        ("DataParity", "IC Data Array Parity Error"),
+        ("DqParity", "Decoupling Queue PhysAddr Parity Error"),
+        ("L0ItlbParity", "L0 ITLB Parity Error"),
+        ("L1ItlbParity", "L1 ITLB Parity Error"),
+        ("L2ItlbParity", "L2 ITLB Parity Error"),
+        ("BpqSnpParT0", "BPQ Thread 0 Snoop Parity Error"),
+        ("BpqSnpParT1", "BPQ Thread 1 Snoop Parity Error"),
+        ("L1BtbMultiHit", "L1 BTB Multi-Match Error"),
+        ("L2BtbMultiHit", "L2 BTB Multi-Match Error"),
+        ("L2RespPoison", "L2 Cache Response Poison Error. Error is the result of consuming poison data"),
+        ("SystemReadDataError", "System Read Data Error. An error in a demand fetch of a line"),
+    )
 
 class BlockL2(Block):
-    def __init__(self):
-        Block.__init__(self)
-        self._acronym = "L2"
-        self._description = "L2 Cache Unit"
-        self._errors_acronyms = [
-            "MultiHit", "Tag", "Data", "Hwa"
-        ]
-        self._errors_descriptions = {
-            "Hwa" : "Hardware Assert Error",
-            "Data" : "L2M Data Array ECC Error",
-            "Tag" : "L2M Tag or State Array ECC Error",
-            "MultiHit" : "L2M Tag Multiple-Way-Hit error"
-        }
+    __slots__ = ()
+    _acronym = "L2"
+    _description = "L2 Cache Unit"
+    _errors = (
+        ("MultiHit", "L2M Tag Multiple-Way-Hit error"),
+        ("Tag", "L2M Tag or State Array ECC Error"),
+        ("Data", "L2M Data Array ECC Error"),
+        ("Hwa", "Hardware Assert Error"),
+    )
 
 class BlockDE(Block):
-    def __init__(self):
-        Block.__init__(self)
-        self._acronym = "DE"
-        self._description = "Decode Unit"
-        self._errors_acronyms = [
-            "OcTag", "OcDat", "Ibq", "UopQ",
-            "Idq", "Faq", "UcDat", "UcSeq", "OCBQ"
-        ]
-        self._errors_descriptions = {
-            "OCBQ" : "Micro-op buffer parity error",
-            "UcSeq" : "Patch RAM sequencer parity error",
-            "UcDat" : "Patch RAM data parity error",
-            "Faq" : "Fetch address FIFO parity error",
-            "Idq" : "Instruction dispatch queue parity error",
-            "UopQ" : "Micro-op queue parity error",
-            "Ibq" : "Instruction buffer parity error",
-            "OcDat" : "Micro-op cache data parity error",
-            "OcTag" : "Micro-op cache tag parity error",
-        }
+    __slots__ = ()
+    _acronym = "DE"
+    _description = "Decode Unit"
+    _errors = (
+        ("OcTag", "Micro-op cache tag parity error"),
+        ("OcDat", "Micro-op cache data parity error"),
+        ("Ibq", "Instruction buffer parity error"),
+        ("UopQ", "Micro-op queue parity error"),
+        ("Idq", "Instruction dispatch queue parity error"),
+        ("Faq", "Fetch address FIFO parity error"),
+        ("UcDat", "Patch RAM data parity error"),
+        ("UcSeq", "Patch RAM sequencer parity error"),
+        ("OCBQ", "Micro-op buffer parity error"),
+    )
 
 class BlockEX(Block):
-    def __init__(self):
-        Block.__init__(self)
-        self._acronym = "EX"
-        self._description = "Execution Unit"
-        self._errors_acronyms = [
-            "WDT", "PRF", "FRF", "IDRF", "PLDAG", "PLDAL",
-            "CHKPTQ", "RETDISP", "STATQ", "SQ", "BBQ"
-        ]
-        self._errors_descriptions = {
-            "BBQ" : "Branch buffer queue parity error",
-            "SQ" : "Scheduling queue parity error",
-            "STATQ" : "Retire status queue parity error.",
-            "RETDISP" : "Retire dispatch queue parity error",
-            "CHKPTQ" : "CHKPTQ. Checkpoint queue parity error",
-            "PLDAL" : "EX payload parity error",
-            "PLDAG" : "Address generator payload parity error",
-            "IDRF" : "Immediate displacement register file parity error",
-            "FRF" : "Flag register file parity error",
-            "PRF" : "Physical register file parity error",
-            "WDT" : "Watchdog Timeout error"
-        }
+    __slots__ = ()
+    _acronym = "EX"
+    _description = "Execution Unit"
+    _errors = (
+        ("WDT", "Watchdog Timeout error"),
+        ("PRF", "Physical register file parity error"),
+        ("FRF", "Flag register file parity error"),
+        ("IDRF", "Immediate displacement register file parity error"),
+        ("PLDAG", "Address generator payload parity error"),
+        ("PLDAL", "EX payload parity error"),
+        ("CHKPTQ", "CHKPTQ. Checkpoint queue parity error"),
+        ("RETDISP", "Retire dispatch queue parity error"),
+        ("STATQ", "Retire status queue parity error."),
+        ("SQ", "Scheduling queue parity error"),
+        ("BBQ", "Branch buffer queue parity error"),
+    )
 
 class BlockFP(Block):
-    def __init__(self):
-        Block.__init__(self)
-        self._acronym = "FP"
-        self._description = "Floating Point Unit"
-        self._errors_acronyms = [
-            "PRF", "FL", "SCH",
-            "NSQ", "RQ", "SRF", "HWA"
-        ]
-        self._errors_descriptions = {
-            "HWA" : "Hardware assertion",
-            "SRF" : "Status register file (SRF) parity error",
-            "RQ" : "Retire queue (RQ) parity error",
-            "NSQ" : "NSQ parity error",
-            "SCH" : "Schedule queue parity error",
-            "FL" : "Freelist (FL) parity error",
-            "PRF" : "Physical register file (PRF) parity error"
-        }
+    __slots__ = ()
+    _acronym = "FP"
+    _description = "Floating Point Unit"
+    _errors = (
+        ("PRF", "Physical register file (PRF) parity error"),
+        ("FL", "Freelist (FL) parity error"),
+        ("SCH", "Schedule queue parity error"),
+        ("NSQ", "NSQ parity error"),
+        ("RQ", "Retire queue (RQ) parity error"),
+        ("SRF", "Status register file (SRF) parity error"),
+        ("HWA", "Hardware assertion"),
+    )
 
 class BlockL3(Block):
-    def __init__(self):
-        Block.__init__(self)
-        self._acronym = "EX"
-        self._description = "L3 Cache Unit"
-        self._errors_acronyms = [
-            "ShadowTag", "MultiHitShadowTag", "Tag",
-            "MultiHitTag", "DataArray", "SdpParity",
-            "XiVictimQueue", "Hwa"
-        ]
-        self._errors_descriptions = {
-            "Hwa" : "L3 Hardware Assertion",
-            "XiVictimQueue" : "L3 Victim Queue Parity Error",
-            "SdpParity" : "SDP Parity Error from XI",
-            "DataArray" : "L3M Data ECC Error",
-            "MultiHitTag" : "L3M Tag Multi-way-hit Error",
-            "Tag" : "L3M Tag ECC Error",
-            "MultiHitShadowTag" : "Shadow Tag Macro Multi-way-hit Error",
-            "ShadowTag" : "Shadow Tag Macro ECC Error"
-        }
+    __slots__ = ()
+    _acronym = "L3"
+    _description = "L3 Cache Unit"
+    _errors = (
+        ("ShadowTag", "Shadow Tag Macro ECC Error"),
+        ("MultiHitShadowTag", "Shadow Tag Macro Multi-way-hit Error"),
+        ("Tag", "L3M Tag ECC Error"),
+        ("MultiHitTag", "L3M Tag Multi-way-hit Error"),
+        ("DataArray", "L3M Data ECC Error"),
+        ("SdpParity", "SDP Parity Error from XI"),
+        ("XiVictimQueue", "L3 Victim Queue Parity Error"),
+        ("Hwa", "L3 Hardware Assertion"),
+    )
 
 class BlockUMC(Block):
-    def __init__(self):
-        Block.__init__(self)
-        self._acronym = "UMC"
-        self._description = "Unified Memory Controller"
-        self._errors_acronyms = [
-            "DramEccErr", "WriteDataPoisonErr", "SdpParityErr",
-            "ApbErr", "AddressCommandParityErr", "WriteDataCrcErr"
-        ]
-        self._errors_descriptions = {
-            "WriteDataCrcErr" : "Write data CRC error. A write data CRC error on the DRAM data bus",
-            "AddressCommandParityErr" : "Address/command parity error. A parity error on the DRAM address/command bus",
-            "ApbErr" : "Advanced peripheral bus error. An error on the advanced peripheral bus",
-            "SdpParityErr" : "SDP parity error. A parity error on write data from the data fabric",
-            "WriteDataPoisonErr" : "Data poison error",
-            "DramEccErr" : "DRAM ECC error. An ECC error on a DRAM read"
-        }
+    __slots__ = ()
+    _acronym = "UMC"
+    _description = "Unified Memory Controller"
+    _errors = (
+        ("DramEccErr", "DRAM ECC error. An ECC error on a DRAM read"),
+        ("WriteDataPoisonErr", "Data poison error"),
+        ("SdpParityErr", "SDP parity error. A parity error on write data from the data fabric"),
+        ("ApbErr", "Advanced peripheral bus error. An error on the advanced peripheral bus"),
+        ("AddressCommandParityErr", "Address/command parity error. A parity error on the DRAM address/command bus"),
+        ("WriteDataCrcErr", "Write data CRC error. A write data CRC error on the DRAM data bus"),
+    )
 
 class BlockPB(Block):
-    def __init__(self):
-        Block.__init__(self)
-        self._acronym = "PB"
-        self._description = "Parameter Block"
-        self._errors_acronyms = ["EccError"]
-        self._errors_descriptions = {"EccError" : "An ECC error in the Parameter Block RAM array",}
+    __slots__ = ()
+    _acronym = "PB"
+    _description = "Parameter Block"
+    _errors = (
+        ("EccError", "An ECC error in the Parameter Block RAM array"),
+    )
 
 class BlockCS(Block):
-    def __init__(self):
-        Block.__init__(self)
-        self._acronym = "CS"
-        self._description = "Coherent Slave"
-        self._errors_acronyms = [
-            "FTI_ILL_REQ", "FTI_ADDR_VIOL", "FTI_SEC_VIOL",
-            "FTI_ILL_RSP", "FTI_RSP_NO_MTCH", "FTI_PAR_ERR",
-            "SDP_PAR_ERR", "ATM_PAR_ERR", "SPF_ECC_ERR"
-        ]
-        self._errors_descriptions = {
-            "SPF_ECC_ERR" : "Probe Filter ECC Error: An ECC error occurred on a probe filter access",
-            "ATM_PAR_ERR" : "Atomic Request Parity Error: Parity error on read of an atomic transaction",
-            "SDP_PAR_ERR" : "Read Response Parity Error: Parity error on incoming read response data",
-            "FTI_PAR_ERR" : "Request or Probe Parity Error: Parity error on incoming request or probe response data",
-            "FTI_RSP_NO_MTCH" : "Unexpected Response: A response was received from the transport layer which does not match any request",
-            "FTI_ILL_RSP" : "Illegal Response: An illegal response was received from the transport layer",
-            "FTI_SEC_VIOL" : "Security Violation: A security violation was received from the transport layer",
-            "FTI_ADDR_VIOL" : "Address Violation: An address violation was received from the transport layer",
-            "FTI_ILL_REQ" : "Illegal Request: An illegal request was received from the transport layer"
-        }
+    __slots__ = ()
+    _acronym = "CS"
+    _description = "Coherent Slave"
+    _errors = (
+        ("FTI_ILL_REQ", "Illegal Request: An illegal request was received from the transport layer"),
+        ("FTI_ADDR_VIOL", "Address Violation: An address violation was received from the transport layer"),
+        ("FTI_SEC_VIOL", "Security Violation: A security violation was received from the transport layer"),
+        ("FTI_ILL_RSP", "Illegal Response: An illegal response was received from the transport layer"),
+        ("FTI_RSP_NO_MTCH", "Unexpected Response: A response was received from the transport layer which does not match any request"),
+        ("FTI_PAR_ERR", "Request or Probe Parity Error: Parity error on incoming request or probe response data"),
+        ("SDP_PAR_ERR", "Read Response Parity Error: Parity error on incoming read response data"),
+        ("ATM_PAR_ERR", "Atomic Request Parity Error: Parity error on read of an atomic transaction"),
+        ("SPF_ECC_ERR", "Probe Filter ECC Error: An ECC error occurred on a probe filter access"),
+    )
 
 class BlockPIE(Block):
-    def __init__(self):
-        Block.__init__(self)
-        self._acronym = "PIE"
-        self._description = "Power Management, Interrupts, Etc."
-        self._errors_acronyms = [
-            "HW_ASSERT", "CSW", "GMI", "FTI_DAT_STAT"
-        ]
-        self._errors_descriptions = {
-            "FTI_DAT_STAT" : "Poison data consumption: Poison data was written to an internal PIE register",
-            "GMI" : "Link Error: An error occurred on a GMI or xGMI link",
-            "CSW" : "Register security violation: A security violation was detected on an access to an internal PIE register",
-            "HW_ASSERT" : "Hardware Assert: A hardware assert was detected"
-        }
-
-BANKS = [
+    __slots__ = ()
+    _acronym = "PIE"
+    _description = "Power Management, Interrupts, Etc."
+    _errors = (
+        ("HW_ASSERT", "Hardware Assert: A hardware assert was detected"),
+        ("CSW", "Register security violation: A security violation was detected on an access to an internal PIE register"),
+        ("GMI", "Link Error: An error occurred on a GMI or xGMI link"),
+        ("FTI_DAT_STAT", "Poison data consumption: Poison data was written to an internal PIE register"),
+    )
+
+_CLASSES = (
     BlockLS,
     BlockIF,
     BlockL2,
@@ -305,32 +232,58 @@ BANKS = [
     BlockEX,
     BlockFP,
     BlockL3,
-    BlockL3,
-    BlockL3,
-    BlockL3,
-    BlockL3,
-    BlockL3,
-    BlockL3,
-    BlockL3,
-    BlockUMC,
     BlockUMC,
     BlockReserved,
-    BlockReserved,
     BlockPB,
     BlockCS,
-    BlockCS,
     BlockPIE,
-]
+)
+
+# Index into _CLASSES for each bank number
+_BANK_TO_CLASS = bytes([0, 1, 2, 3, 4, 5, 6, 7, 7, 7, 7, 7, 7, 7, 7, 8, 8, 9, 9, 10, 11, 11, 12])
+
+BANKS = tuple(_CLASSES[i] for i in _BANK_TO_CLASS)
+BANK_INFO = tuple((cls._acronym, cls._description) for cls in BANKS)
+
+
+def _padded_row(cls):
+    # Tables are checked once here so that decode() needs no guards
+    assert cls._acronym and cls._description, cls.__name__
+    assert len(cls._errors) <= _ERR_MASK + 1, cls.__name__
+    assert all(len(error) == 2 for error in cls._errors), cls.__name__
+    return cls._errors + (("", ""),) * (_ERR_MASK + 1 - len(cls._errors))
+
+# One row per bank, padded so that every ErrorCodeExt value is a valid index.
+# Banks of the same type share their row.
+_ROWS = tuple(_padded_row(cls) for cls in _CLASSES)
+_LUT = tuple(_ROWS[i] for i in _BANK_TO_CLASS)
+
+
+def decode(bank_number, status):
+    code = (status >> _ERR_SHIFT) & _ERR_MASK
+    acronym, description = _LUT[bank_number][code]
+    return ErrorCodeExt(code, acronym, description)
+
+# ErrorCodeExt is immutable, so repeated events can share one instance
+@lru_cache(maxsize=512)
+def decode_cached(bank_number, code):
+    acronym, description = _LUT[bank_number][code]
+    return ErrorCodeExt(code, acronym, description)
+
+def decode_many(banks, statuses):
+    return [decode_cached(bank, (status >> _ERR_SHIFT) & _ERR_MASK) for bank, status in zip(banks, statuses)]
 
 
 if __name__ == "__main__":
+    import sys
+
     if len(sys.argv) < 3:
-        print("USAGE: {} <bank_number> <status_code>".format(sys.argv[0]))
+        print(f"USAGE: {sys.argv[0]} <bank_number> <status_code>")
         exit(1)
 
     bank_number = int(sys.argv[1])
     status_code = int(sys.argv[2], 16)
-    bank = BANKS[bank_number]()
-    print("Bank: {}".format(bank))
-    error = bank.decode_error(status_code)
-    print("Error: {}".format(error))
+    acronym, description = BANK_INFO[bank_number]
+    print(f"Bank: {description} ({acronym})")
+    error = decode(bank_number, status_code)
+    print(f"Error: {error}")